@@ -9,12 +9,9 @@ from alembic import context
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from config import settings
-from database import Base
 
-# Import all models so Alembic can detect them
-from models.user import User
-from models.task import Task
-from models.habit import Habit, HabitLog
+# Importing models registers every table on Base.metadata so Alembic can detect them
+from models import Base
 
 config = context.config
 
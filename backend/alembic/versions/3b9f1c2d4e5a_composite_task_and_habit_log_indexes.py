@@ -0,0 +1,38 @@
+"""composite task and habit log indexes
+
+Revision ID: 3b9f1c2d4e5a
+Revises: 7932beeae3e2
+Create Date: 2026-10-15 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b9f1c2d4e5a'
+down_revision: Union[str, Sequence[str], None] = '7932beeae3e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_tasks_user_status', table_name='tasks')
+    op.drop_index('ix_tasks_user_deleted', table_name='tasks')
+    op.create_index('ix_tasks_user_active_status', 'tasks', ['user_id', 'is_deleted', 'status', 'created_at'])
+
+    op.drop_index('ix_habit_logs_habit_date', table_name='habit_logs')
+    op.create_index('ix_habit_logs_habit_date_completed', 'habit_logs', ['habit_id', 'date', 'completed'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_habit_logs_habit_date_completed', table_name='habit_logs')
+    op.create_index('ix_habit_logs_habit_date', 'habit_logs', ['habit_id', 'date'])
+
+    op.drop_index('ix_tasks_user_active_status', table_name='tasks')
+    op.create_index('ix_tasks_user_deleted', 'tasks', ['user_id', 'is_deleted'])
+    op.create_index('ix_tasks_user_status', 'tasks', ['user_id', 'status'])
@@ -0,0 +1,58 @@
+"""hash refresh tokens
+
+Revision ID: 8d2e4a6f1b3c
+Revises: 3b9f1c2d4e5a
+Create Date: 2026-10-15 09:48:05.527391
+
+"""
+import hashlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4a6f1b3c'
+down_revision: Union[str, Sequence[str], None] = '3b9f1c2d4e5a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('refresh_tokens', sa.Column('token_hash', sa.LargeBinary(length=32), nullable=True))
+
+    # Backfill so sessions issued before this migration keep working
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, token FROM refresh_tokens")).fetchall()
+    for token_id, token in rows:
+        bind.execute(
+            sa.text("UPDATE refresh_tokens SET token_hash = :h WHERE id = :id"),
+            {"h": hashlib.sha256(token.encode()).digest(), "id": token_id},
+        )
+
+    op.drop_index('ix_refresh_tokens_token', table_name='refresh_tokens')
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.alter_column('token_hash', existing_type=sa.LargeBinary(length=32), nullable=False)
+        batch_op.drop_column('token')
+    op.create_index('ix_refresh_tokens_token_hash', 'refresh_tokens', ['token_hash'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Raw tokens can't be recovered from their hashes — every existing token is revoked
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(), nullable=True))
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("SELECT id, token_hash FROM refresh_tokens")).fetchall()
+    for token_id, token_hash in rows:
+        bind.execute(
+            sa.text("UPDATE refresh_tokens SET token = :t, revoked = :r WHERE id = :id"),
+            {"t": bytes(token_hash).hex(), "r": True, "id": token_id},
+        )
+
+    op.drop_index('ix_refresh_tokens_token_hash', table_name='refresh_tokens')
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.alter_column('token', existing_type=sa.String(), nullable=False)
+        batch_op.drop_column('token_hash')
+    op.create_index('ix_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True)
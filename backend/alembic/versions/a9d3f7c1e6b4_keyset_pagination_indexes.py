@@ -0,0 +1,37 @@
+"""keyset pagination indexes
+
+Revision ID: a9d3f7c1e6b4
+Revises: f6b2c8d4a1e7
+Create Date: 2026-10-15 14:02:51.603318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d3f7c1e6b4'
+down_revision: Union[str, Sequence[str], None] = 'f6b2c8d4a1e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_user_active_created', 'tasks', ['user_id', 'is_deleted', 'created_at', 'id'], unique=False)
+    op.create_index('ix_habits_user_active_created', 'habits', ['user_id', 'is_deleted', 'created_at', 'id'], unique=False)
+    # (user_id) and (user_id, is_deleted) are prefixes of the new indexes
+    op.drop_index('ix_tasks_user_id', table_name='tasks')
+    op.drop_index('ix_habits_user_id', table_name='habits')
+    op.drop_index('ix_habits_user_deleted', table_name='habits')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_habits_user_deleted', 'habits', ['user_id', 'is_deleted'], unique=False)
+    op.create_index('ix_habits_user_id', 'habits', ['user_id'], unique=False)
+    op.create_index('ix_tasks_user_id', 'tasks', ['user_id'], unique=False)
+    op.drop_index('ix_habits_user_active_created', table_name='habits')
+    op.drop_index('ix_tasks_user_active_created', table_name='tasks')
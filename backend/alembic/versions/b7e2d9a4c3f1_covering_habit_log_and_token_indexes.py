@@ -0,0 +1,47 @@
+"""covering habit log and refresh token indexes
+
+Revision ID: b7e2d9a4c3f1
+Revises: a9d3f7c1e6b4
+Create Date: 2026-10-15 14:31:07.118420
+
+"""
+from contextlib import nullcontext
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d9a4c3f1'
+down_revision: Union[str, Sequence[str], None] = 'a9d3f7c1e6b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _online():
+    """On Postgres build/drop indexes CONCURRENTLY — outside a transaction, without locking writes."""
+    if op.get_bind().dialect.name == "postgresql":
+        return op.get_context().autocommit_block(), {"postgresql_concurrently": True}
+    return nullcontext(), {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    block, kw = _online()
+    with block:
+        op.create_index('ix_habit_logs_habit_completed_date', 'habit_logs', ['habit_id', 'completed', 'date'], unique=False, **kw)
+        op.drop_index('ix_habit_logs_habit_date_completed', table_name='habit_logs', **kw)
+        op.create_index('ix_refresh_tokens_user_active', 'refresh_tokens', ['user_id'], unique=False,
+                        postgresql_where=sa.text('revoked = false'), sqlite_where=sa.text('revoked = 0'), **kw)
+        op.drop_index('ix_refresh_tokens_user_id', table_name='refresh_tokens', **kw)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    block, kw = _online()
+    with block:
+        op.create_index('ix_refresh_tokens_user_id', 'refresh_tokens', ['user_id'], unique=False, **kw)
+        op.drop_index('ix_refresh_tokens_user_active', table_name='refresh_tokens', **kw)
+        op.create_index('ix_habit_logs_habit_date_completed', 'habit_logs', ['habit_id', 'date', 'completed'], unique=False, **kw)
+        op.drop_index('ix_habit_logs_habit_completed_date', table_name='habit_logs', **kw)
@@ -0,0 +1,47 @@
+"""store password hash as bytes
+
+Revision ID: c4a7e9b2d815
+Revises: 8d2e4a6f1b3c
+Create Date: 2026-10-15 10:21:37.904416
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a7e9b2d815'
+down_revision: Union[str, Sequence[str], None] = '8d2e4a6f1b3c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        # SQLite keeps the declared type loosely — convert the stored values themselves
+        op.execute("UPDATE users SET password_hash = CAST(password_hash AS BLOB)")
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column(
+            'password_hash',
+            existing_type=sa.String(),
+            type_=sa.LargeBinary(),
+            existing_nullable=False,
+            postgresql_using="convert_to(password_hash, 'UTF8')",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("UPDATE users SET password_hash = CAST(password_hash AS TEXT)")
+    with op.batch_alter_table('users') as batch_op:
+        batch_op.alter_column(
+            'password_hash',
+            existing_type=sa.LargeBinary(),
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using="convert_from(password_hash, 'UTF8')",
+        )
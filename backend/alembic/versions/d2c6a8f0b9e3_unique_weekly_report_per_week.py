@@ -0,0 +1,36 @@
+"""unique weekly report per week
+
+Revision ID: d2c6a8f0b9e3
+Revises: b7e2d9a4c3f1
+Create Date: 2026-10-15 15:04:42.879215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2c6a8f0b9e3'
+down_revision: Union[str, Sequence[str], None] = 'b7e2d9a4c3f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the newest report for any (user, week) written twice
+    op.execute(
+        "DELETE FROM weekly_reports WHERE id NOT IN "
+        "(SELECT MAX(id) FROM weekly_reports GROUP BY user_id, week_start)"
+    )
+    op.create_index('uq_weekly_reports_user_week', 'weekly_reports', ['user_id', 'week_start'], unique=True)
+    # user_id is a prefix of the new index
+    op.drop_index('ix_weekly_reports_user_id', table_name='weekly_reports')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_weekly_reports_user_id', 'weekly_reports', ['user_id'], unique=False)
+    op.drop_index('uq_weekly_reports_user_week', table_name='weekly_reports')
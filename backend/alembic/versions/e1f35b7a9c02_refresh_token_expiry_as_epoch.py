@@ -0,0 +1,48 @@
+"""refresh token expiry as epoch
+
+Revision ID: e1f35b7a9c02
+Revises: c4a7e9b2d815
+Create Date: 2026-10-15 11:03:52.671148
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1f35b7a9c02'
+down_revision: Union[str, Sequence[str], None] = 'c4a7e9b2d815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Stored datetimes are naive UTC
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("UPDATE refresh_tokens SET expires_at = CAST(strftime('%s', expires_at) AS INTEGER)")
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.alter_column(
+            'expires_at',
+            existing_type=sa.DateTime(),
+            type_=sa.BigInteger(),
+            existing_nullable=False,
+            postgresql_using="EXTRACT(EPOCH FROM expires_at)::bigint",
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('refresh_tokens') as batch_op:
+        batch_op.alter_column(
+            'expires_at',
+            existing_type=sa.BigInteger(),
+            type_=sa.DateTime(),
+            existing_nullable=False,
+            postgresql_using="to_timestamp(expires_at) AT TIME ZONE 'UTC'",
+        )
+    # After the rebuild — SQLite's CAST to DATETIME would mangle a text timestamp
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("UPDATE refresh_tokens SET expires_at = datetime(expires_at, 'unixepoch')")
@@ -0,0 +1,75 @@
+"""materialized habit streaks
+
+Revision ID: e8a4b1c7d5f2
+Revises: d2c6a8f0b9e3
+Create Date: 2026-10-15 16:12:35.407721
+
+"""
+from itertools import groupby
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8a4b1c7d5f2'
+down_revision: Union[str, Sequence[str], None] = 'd2c6a8f0b9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+habits = sa.table(
+    'habits',
+    sa.column('id', sa.Integer),
+    sa.column('current_streak', sa.Integer),
+    sa.column('last_logged_date', sa.Date),
+)
+habit_logs = sa.table(
+    'habit_logs',
+    sa.column('habit_id', sa.Integer),
+    sa.column('date', sa.Date),
+    sa.column('completed', sa.Boolean),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('habits') as batch_op:
+        batch_op.add_column(sa.Column('current_streak', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('last_logged_date', sa.Date(), nullable=True))
+
+    # Backfill — each habit's newest check-in and the run of days ending there
+    conn = op.get_bind()
+    logs = conn.execute(
+        sa.select(habit_logs.c.habit_id, habit_logs.c.date)
+        .where(habit_logs.c.completed == sa.true())
+        .order_by(habit_logs.c.habit_id, habit_logs.c.date.desc())
+    )
+    rows = []
+    for habit_id, group in groupby(logs, key=lambda r: r.habit_id):
+        group = list(group)
+        # Walk day ordinals as plain ints — no date/timedelta objects per log
+        days  = [r.date.toordinal() for r in group]
+        first = days[0]
+        streak = 1
+        for day in days[1:]:
+            if day != first - streak:
+                break
+            streak += 1
+        rows.append({'hid': habit_id, 'streak': streak, 'last': group[0].date})
+
+    if rows:
+        conn.execute(
+            habits.update()
+            .where(habits.c.id == sa.bindparam('hid'))
+            .values(current_streak=sa.bindparam('streak'), last_logged_date=sa.bindparam('last')),
+            rows,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('habits') as batch_op:
+        batch_op.drop_column('last_logged_date')
+        batch_op.drop_column('current_streak')
@@ -0,0 +1,45 @@
+"""unique habit log per day
+
+Revision ID: f6b2c8d4a1e7
+Revises: e1f35b7a9c02
+Create Date: 2026-10-15 13:36:18.240957
+
+"""
+from contextlib import nullcontext
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2c8d4a1e7'
+down_revision: Union[str, Sequence[str], None] = 'e1f35b7a9c02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _online():
+    """On Postgres build/drop indexes CONCURRENTLY — outside a transaction, without locking writes."""
+    if op.get_bind().dialect.name == "postgresql":
+        return op.get_context().autocommit_block(), {"postgresql_concurrently": True}
+    return nullcontext(), {}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Keep only the newest log for any (habit, date) the old SELECT-then-INSERT raced on
+    op.execute(
+        "DELETE FROM habit_logs WHERE id NOT IN "
+        "(SELECT MAX(id) FROM habit_logs GROUP BY habit_id, date)"
+    )
+    block, kw = _online()
+    with block:
+        op.create_index('uq_habit_logs_habit_date', 'habit_logs', ['habit_id', 'date'], unique=True, **kw)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    block, kw = _online()
+    with block:
+        op.drop_index('uq_habit_logs_habit_date', table_name='habit_logs', **kw)
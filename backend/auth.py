@@ -1,7 +1,7 @@
 # backend/auth.py
 from datetime import datetime, timedelta, timezone
 from passlib.context import CryptContext
-from jose import jwt
+import jwt
 from config import settings
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
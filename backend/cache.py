@@ -0,0 +1,134 @@
+# backend/cache.py
+import threading
+import time
+from fnmatch import fnmatchcase
+import orjson
+import redis
+from cachetools import TLRUCache
+from config import settings
+from core.logging import logger
+
+# ════════════════════════════════════════
+# RESPONSE CACHE  (dashboard + latest report)
+# ════════════════════════════════════════
+# Backed by Redis when REDIS_URL is set. Without Redis, LOCAL_CACHE=true keeps
+# entries in this process instead — only safe with a single worker, since other
+# workers would never see its invalidations. Otherwise every lookup is a miss.
+# A Redis outage is logged and treated as a miss, so requests fall back to the DB.
+#
+# Circuit breaker: after any RedisError, Redis is skipped entirely for
+# REDIS_BACKOFF seconds, so an outage costs one timeout, not one per call.
+# Redis entries never live longer than that window, so whatever a failed
+# delete left behind has expired before Redis is read again.
+
+DEFAULT_TTL   = 30            # seconds
+REDIS_BACKOFF = DEFAULT_TTL   # seconds Redis is skipped after an error — keep >= every Redis TTL
+
+_client = (
+    redis.Redis.from_url(settings.REDIS_URL, socket_timeout=0.25, socket_connect_timeout=0.25)
+    if settings.REDIS_URL else None
+)
+_redis_down_until = 0.0   # monotonic time the breaker closes again
+
+# key → (orjson bytes, ttl) — stored serialized like Redis, so callers never share objects
+_local = (
+    TLRUCache(maxsize=10_000, ttu=lambda _key, entry, now: now + entry[1], timer=time.monotonic)
+    if _client is None and settings.LOCAL_CACHE else None
+)
+_local_lock = threading.Lock()
+
+
+def _redis():
+    """The Redis client — None when unconfigured or while backing off after an error."""
+    if _client is None or time.monotonic() < _redis_down_until:
+        return None
+    return _client
+
+
+def _redis_failed(action: str, target, e: Exception):
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_BACKOFF
+    logger.warning(f"Cache {action} failed for {target}: {e} — skipping Redis for {REDIS_BACKOFF}s")
+
+
+def dashboard_key(user_id: int) -> str:
+    return f"dashboard:{user_id}"
+
+
+def report_key(user_id: int) -> str:
+    return f"report:{user_id}"
+
+
+def cache_get(key: str):
+    if _local is not None:
+        with _local_lock:
+            entry = _local.get(key)
+        return orjson.loads(entry[0]) if entry is not None else None
+    client = _redis()
+    if client is None:
+        return None
+    try:
+        raw = client.get(key)
+    except redis.RedisError as e:
+        _redis_failed("read", key, e)
+        return None
+    return orjson.loads(raw) if raw is not None else None
+
+
+def cache_set(key: str, value, ttl: int = DEFAULT_TTL):
+    if _local is not None:
+        entry = (orjson.dumps(value), ttl)
+        with _local_lock:
+            _local[key] = entry
+        return
+    client = _redis()
+    if client is None:
+        return
+    try:
+        # capped so no entry outlives the breaker window — see the note at the top
+        client.set(key, orjson.dumps(value), ex=min(ttl, REDIS_BACKOFF))
+    except redis.RedisError as e:
+        _redis_failed("write", key, e)
+
+
+def cache_del(*keys: str):
+    if _local is not None:
+        with _local_lock:
+            for key in keys:
+                _local.pop(key, None)
+        return
+    client = _redis()
+    if client is None or not keys:
+        return
+    try:
+        client.delete(*keys)
+    except redis.RedisError as e:
+        _redis_failed("delete", keys, e)
+
+
+def cache_del_pattern(pattern: str):
+    """Deletes every key matching pattern — SCAN based, never blocks Redis like KEYS."""
+    if _local is not None:
+        with _local_lock:
+            for key in [k for k in _local if fnmatchcase(k, pattern)]:
+                del _local[key]
+        return
+    client = _redis()
+    if client is None:
+        return
+    try:
+        batch = []
+        for key in client.scan_iter(match=pattern, count=500):
+            batch.append(key)
+            if len(batch) >= 500:
+                client.delete(*batch)
+                batch = []
+        if batch:
+            client.delete(*batch)
+    except redis.RedisError as e:
+        _redis_failed("delete", pattern, e)
+
+
+def invalidate_user(user_id: int):
+    # Any task/habit change alters the dashboard numbers
+    cache_del(dashboard_key(user_id))
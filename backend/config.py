@@ -1,4 +1,5 @@
 # backend/config.py
+from typing import Optional
 from pydantic_settings import BaseSettings
 
 class Settings(BaseSettings):
@@ -6,7 +7,10 @@ class Settings(BaseSettings):
     DATABASE_URL: str = "sqlite:///./lifeos.db"
     DEBUG: bool = False
     ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15   # short-lived — clients renew via /refresh
+    BCRYPT_COST: int = 12   # bcrypt work factor — drop to 4 for tests/dev
+    REDIS_URL: Optional[str] = None   # response cache — disabled when unset
+    LOCAL_CACHE: bool = False   # in-process response cache when REDIS_URL is unset — single worker only
 
     class Config:
         env_file = ".env"
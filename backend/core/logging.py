@@ -1,8 +1,37 @@
 # backend/core/logging.py
+import atexit
 import logging
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from config import settings
 
+LOG_BUFFER_SIZE    = 64 * 1024   # bytes held before the file is written
+LOG_FLUSH_INTERVAL = 5           # seconds between forced flushes
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that lets a large stream buffer batch writes instead of
+    flushing after every record. ERROR and above are flushed immediately.
+    """
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record):
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+
 def setup_logging():
     log_level = logging.DEBUG if settings.DEBUG else logging.INFO
 
@@ -15,14 +44,39 @@ def setup_logging():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
 
-    # File handler — saves logs to lifeos.log
-    file_handler = logging.FileHandler("lifeos.log", encoding="utf-8")
+    # File handler — saves logs to lifeos.log, batched through a 64 KB buffer
+    file_handler = BufferedFileHandler("lifeos.log", encoding="utf-8")
     file_handler.setFormatter(formatter)
 
+    # Request threads only enqueue records — a background listener does the actual IO
+    log_queue = queue.Queue(-1)
+    listener  = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+
+    # Quiet periods still reach disk within LOG_FLUSH_INTERVAL seconds
+    stop_flushing = threading.Event()
+
+    def flush_periodically():
+        while not stop_flushing.wait(LOG_FLUSH_INTERVAL):
+            file_handler.flush()
+
+    threading.Thread(target=flush_periodically, name="log-flush", daemon=True).start()
+
+    def shutdown():
+        listener.stop()
+        stop_flushing.set()
+        file_handler.close()
+
+    atexit.register(shutdown)
+
+    # Only the message is rendered before enqueueing — the real formatter runs on the listener
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     # Root logger setup
     logging.basicConfig(
         level=log_level,
-        handlers=[console_handler, file_handler]
+        handlers=[queue_handler]
     )
 
     # Silence noisy libraries
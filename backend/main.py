@@ -1,75 +1,96 @@
 # backend/main.py
+import asyncio
+import hashlib
 import logging
+import os
+import threading
 import time
-from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Optional
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
+import jwt
 import bcrypt
-from pydantic_settings import BaseSettings
-from sqlalchemy import create_engine
+from cachetools import TLRUCache, TTLCache
+from alembic import command
+from alembic.config import Config as AlembicConfig
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import Session, sessionmaker
 # Update this import line if your project structure is different
+import cache
 import models
 import schemas
 import services
+from config import settings
+from core.logging import logger, setup_logging
 from models import Base
-from apscheduler.schedulers.background import BackgroundScheduler
-# Rate limiter — identifies users by their IP address
-limiter = Limiter(key_func=get_remote_address)
-# ════════════════════════════════════════
-# CONFIG  (reads from .env automatically)
-# ════════════════════════════════════════
-
-class Settings(BaseSettings):
-    SECRET_KEY: str
-    DATABASE_URL: str = "sqlite:///./lifeos.db"
-    DEBUG: bool = False
-    ALGORITHM: str = "HS256"
-    ACCESS_TOKEN_EXPIRE_MINUTES: int = 15   # 7 days
-
-    class Config:
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-
-settings = Settings()
-
-
-# ════════════════════════════════════════
-# LOGGING
-# ════════════════════════════════════════
-
-logging.basicConfig(
-    level=logging.DEBUG if settings.DEBUG else logging.INFO,
-    format="%(asctime)s | %(levelname)-8s | %(message)s",
-    datefmt="%Y-%m-%d %H:%M:%S",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("lifeos.log", encoding="utf-8"),
-    ],
-)
-logging.getLogger("passlib").setLevel(logging.WARNING)
-logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
-logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
-
-logger = logging.getLogger("lifeos")
 
+setup_logging()
 
+# Rate limiter — identifies users by their IP address
+limiter = Limiter(key_func=get_remote_address)
 # ════════════════════════════════════════
 # DATABASE
 # ════════════════════════════════════════
 
-connect_args = {"check_same_thread": False} if settings.DATABASE_URL.startswith("sqlite") else {}
-engine       = create_engine(settings.DATABASE_URL, connect_args=connect_args)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+if settings.DATABASE_URL.startswith("sqlite"):
+    engine = create_engine(settings.DATABASE_URL, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_conn, _record):
+        # WAL + synchronous=NORMAL: writes no longer fsync on every commit
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")   # 64 MB page cache
+        cursor.close()
+else:
+    engine = create_engine(
+        settings.DATABASE_URL,
+        pool_size=20,
+        max_overflow=40,
+        pool_recycle=1800,     # recycle before server-side idle timeouts
+        pool_pre_ping=True,    # drop stale sockets instead of failing a request
+    )
+# Every column default is Python-side, so objects are complete after flush —
+# keeping them loaded past commit saves a SELECT per write (no db.refresh needed)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+def _alembic_config() -> AlembicConfig:
+    # No alembic.ini here — its logging section would replace the app's handlers
+    cfg = AlembicConfig()
+    cfg.set_main_option("script_location", os.path.join(os.path.dirname(os.path.abspath(__file__)), "alembic"))
+    return cfg
+
+
+def init_db():
+    # Brings the schema to head — called on server startup, never on import.
+    # Fresh database: create every table from the models and stamp it at head.
+    # Existing database: apply any pending migrations.
+    # Databases built by the old create_all-only startup have no alembic_version
+    # table — run `alembic stamp 7932beeae3e2` once before the first upgrade.
+    inspector = inspect(engine)
+    alembic_cfg = _alembic_config()
+    if not inspector.has_table("users"):
+        Base.metadata.create_all(bind=engine)
+        command.stamp(alembic_cfg, "head")
+        return
+    if not inspector.has_table("alembic_version"):
+        raise RuntimeError(
+            "Database has tables but no alembic_version — "
+            "run `alembic stamp 7932beeae3e2` once from backend/, then restart"
+        )
+    command.upgrade(alembic_cfg, "head")
 
-Base.metadata.create_all(bind=engine, checkfirst=True)  # remove this once Alembic is set up
 
 def get_db():
     db = SessionLocal()
@@ -89,29 +110,74 @@ def get_db():
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/login")
 
-def hash_password(password: str) -> str:
+# Encoded once — PyJWT would otherwise re-encode the str key on every encode/decode
+SECRET_KEY_BYTES = settings.SECRET_KEY.encode("utf-8")
+
+# Already-verified access tokens → (user_id, email, exp).
+# Keyed by a hash of the token so raw tokens never sit in memory.
+# An entry lives for at most TOKEN_CACHE_TTL seconds and never past the token's own expiry.
+TOKEN_CACHE_TTL  = 30
+_token_cache     = TLRUCache(
+    maxsize=10000,
+    ttu=lambda _key, value, now: min(now + TOKEN_CACHE_TTL, value[2]),
+    timer=time.time,
+)
+_token_cache_lock = threading.Lock()
+
+# email → user id. Only the id is cached — the row itself is always re-read by
+# primary key, so a changed password or role is never served stale.
+_user_id_by_email      = TTLCache(maxsize=2048, ttl=30)
+_user_id_by_email_lock = threading.Lock()
+
+
+def get_user_by_email_cached(db: Session, email: str):
+    with _user_id_by_email_lock:
+        user_id = _user_id_by_email.get(email)
+    if user_id is not None:
+        user = db.get(models.User, user_id)
+        if user and user.email == email:
+            return user
+
+    user = services.get_user_by_email(db, email)
+    if user:
+        with _user_id_by_email_lock:
+            _user_id_by_email[email] = user.id
+    return user
+
+
+def forget_user_email(email: str):
+    with _user_id_by_email_lock:
+        _user_id_by_email.pop(email, None)
+
+def hash_password(password: str) -> bytes:
     # Bcrypt requires bytes. We also truncate to 72 bytes to prevent length errors.
+    # The hash is stored as-is (LargeBinary) — no decode/encode round trip.
     pwd_bytes = password[:72].encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(pwd_bytes, salt)
-    return hashed_password.decode('utf-8')
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_COST)
+    return bcrypt.hashpw(pwd_bytes, salt)
 
 
-def verify_password(plain: str, hashed: str) -> bool:
-    # Encode both strings to bytes for comparison
+def verify_password(plain: str, hashed: bytes) -> bool:
     plain_bytes = plain[:72].encode('utf-8')
-    hashed_bytes = hashed.encode('utf-8')
     try:
         # Check if the plain password matches the hashed one
-        return bcrypt.checkpw(plain_bytes, hashed_bytes)
-    except (ValueError, TypeError, Exception):
-        # Triggers if the hashed string is invalid, corrupted, or missing
+        return bcrypt.checkpw(plain_bytes, hashed)
+    except ValueError:
+        # Triggers if the hash is corrupted. A str hash (unmigrated column) is a
+        # TypeError and is left to raise — it must not look like a wrong password.
         return False
 
+# bcrypt is deliberately slow — run it on its own bounded pool so a burst of
+# logins can't starve the threadpool that serves sync routes and DB calls.
+_bcrypt_pool = ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="bcrypt")
+
+async def run_bcrypt(fn, *args):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_pool, fn, *args)
+
 def create_access_token(email: str) -> str:
-    expire  = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    payload = {"sub": email, "exp": expire}
-    return jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    payload = {"sub": email, "exp": int(time.time()) + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60}
+    return jwt.encode(payload, SECRET_KEY_BYTES, algorithm=settings.ALGORITHM)
 
 
 def get_current_user(
@@ -123,17 +189,31 @@ def get_current_user(
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    key = hashlib.sha256(token.encode()).hexdigest()[:32]
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+    if cached:
+        # Token was verified recently — skip JWT decode + email lookup, PK get only
+        user = db.get(models.User, cached[0])
+        if user:
+            return user
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY_BYTES, algorithms=[settings.ALGORITHM])
         email: str = payload.get("sub")
         if not email:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
 
-    user = services.get_user_by_email(db, email)
+    user = get_user_by_email_cached(db, email)
     if not user:
         raise credentials_exception
+
+    exp = payload.get("exp", time.time() + TOKEN_CACHE_TTL)
+    if exp > time.time():
+        with _token_cache_lock:
+            _token_cache[key] = (user.id, email, exp)
     return user
 
 
@@ -141,10 +221,22 @@ def get_current_user(
 # APP + MIDDLEWARE
 # ════════════════════════════════════════
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Started with the server, not on import — tooling and tests can import main freely
+    init_db()
+    scheduler = start_scheduler()
+    yield
+    scheduler.shutdown(wait=False)
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="LifeOS API",
     version="3.0.0",
     description="Personal productivity system — tasks, habits, dashboard",
+    # Schema + /docs + /redoc only in DEBUG — production never builds the OpenAPI graph
+    openapi_url="/openapi.json" if settings.DEBUG else None,
 )
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
@@ -153,17 +245,19 @@ app.add_middleware(
     allow_origins=["*"], 
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-    allow_headers=["*"],
+    allow_headers=["Authorization", "Content-Type"],   # all the frontend ever sends
     expose_headers=["*"], # Crucial for mobile browsers
 )
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    start    = time.time()
+    start    = time.perf_counter_ns()
     response = await call_next(request)
-    ms       = (time.time() - start) * 1000
-    logger.info(f"{request.method} {request.url.path} → {response.status_code} ({ms:.0f}ms)")
+    if logger.isEnabledFor(logging.INFO):
+        # %-style args — the message is only built if a handler actually emits it
+        logger.info("%s %s → %s (%dms)", request.method, request.url.path,
+                    response.status_code, (time.perf_counter_ns() - start) // 1_000_000)
     return response
 
 
@@ -190,31 +284,36 @@ def run_weekly_reports():
     logger.info("Background job started — generating weekly reports...")
     db = SessionLocal()
     try:
-        users = services.get_all_users(db)
-        for user in users:
-            try:
-                result = services.generate_weekly_report(db, user)
-                logger.info(f"Report generated for {user.email} — score: {result['score']}")
-            except Exception as e:
-                logger.error(f"Failed to generate report for {user.email}: {e}")
-        logger.info(f"Weekly reports done — processed {len(users)} users.")
+        scores = services.generate_weekly_reports(db)
+        cache.cache_del_pattern("report:*")
+        logger.info(f"Weekly reports done — processed {len(scores)} users.")
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to generate weekly reports: {e}", exc_info=True)
     finally:
         db.close()
 
 
-# Start scheduler — won't block the server
-scheduler = BackgroundScheduler()
-scheduler.add_job(
-    run_weekly_reports,
-    trigger='cron',
-    day_of_week='mon',    # every Monday
-    hour=8,               # at 8am
-    minute=0,
-    id='weekly_reports',
-    replace_existing=True,
-)
-scheduler.start()
-logger.info("Background scheduler started — weekly reports run every Monday at 8am")
+def start_scheduler():
+    """
+    Starts the weekly report scheduler — won't block the server.
+    APScheduler is imported here so importing main stays cheap.
+    """
+    from apscheduler.schedulers.background import BackgroundScheduler
+
+    scheduler = BackgroundScheduler()
+    scheduler.add_job(
+        run_weekly_reports,
+        trigger='cron',
+        day_of_week='mon',    # every Monday
+        hour=8,               # at 8am
+        minute=0,
+        id='weekly_reports',
+        replace_existing=True,
+    )
+    scheduler.start()
+    logger.info("Background scheduler started — weekly reports run every Monday at 8am")
+    return scheduler
 # ════════════════════════════════════════
 # ROUTES — all under /api/v1/
 # ════════════════════════════════════════
@@ -228,15 +327,16 @@ def health_check():
 # ── Auth ────────────────────────────────
 @app.post("/api/v1/users/", response_model=schemas.UserResponse, tags=["Auth"])
 @limiter.limit("3/minute")   # ← add this line
-def register(
+async def register(
     request: Request,        # ← add request as first parameter
     user: schemas.UserCreate,
     db: Session = Depends(get_db)
 ):
-    if services.get_user_by_email(db, user.email):
+    if await run_in_threadpool(services.get_user_by_email, db, user.email):
         logger.warning(f"Registration attempt with existing email: {user.email}")
         raise HTTPException(status_code=400, detail="Email already registered")
-    new_user = services.create_user(db, user.name, user.email, hash_password(user.password))
+    password_hash = await run_bcrypt(hash_password, user.password)
+    new_user = await run_in_threadpool(services.create_user, db, user.name, user.email, password_hash)
     logger.info(f"New user registered: {user.email}")
     return new_user
 
@@ -246,9 +346,14 @@ def get_latest_report(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    report = services.get_latest_report(db, current_user.id)
-    if not report:
-        raise HTTPException(status_code=404, detail="No report yet — check back after Monday!")
+    key    = cache.report_key(current_user.id)
+    report = cache.cache_get(key)
+    if report is None:
+        report = services.get_latest_report(db, current_user.id)
+        if not report:
+            raise HTTPException(status_code=404, detail="No report yet — check back after Monday!")
+        report = schemas.WeeklyReportResponse.model_validate(report).model_dump(mode="json")
+        cache.cache_set(key, report)
     return report
 
 
@@ -262,18 +367,19 @@ def generate_report_now(
     Useful for testing without waiting until Monday.
     """
     result = services.generate_weekly_report(db, current_user)
+    cache.cache_del(cache.report_key(current_user.id))
     logger.info(f"Manual report generated for {current_user.email}")
     return {"message": "Report generated!", "score": result["score"]}
 
 @app.post("/api/v1/login", response_model=schemas.TokenPair, tags=["Auth"])
 @limiter.limit("5/minute")
-def login(
+async def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
-    user = services.get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.password_hash):
+    user = await run_in_threadpool(get_user_by_email_cached, db, form_data.username)
+    if not user or not await run_bcrypt(verify_password, form_data.password, user.password_hash):
         logger.warning(f"Failed login attempt: {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -282,7 +388,7 @@ def login(
         )
 
     access_token  = create_access_token(user.email)
-    refresh_token = services.create_refresh_token(db, user.id)
+    refresh_token = await run_in_threadpool(services.create_refresh_token, db, user.id)
 
     logger.info(f"User logged in: {user.email}")
     return {
@@ -302,17 +408,18 @@ def refresh_token(
         raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
 
     # Check it hasn't expired
-    if datetime.now(timezone.utc) > db_token.expires_at.replace(tzinfo=timezone.utc):
+    if time.time() > db_token.expires_at:
         services.revoke_refresh_token(db, payload.refresh_token)
         raise HTTPException(status_code=401, detail="Refresh token expired. Please log in again.")
 
     # Get the user
-    user = db.query(models.User).filter(models.User.id == db_token.user_id).first()
+    user = db.get(models.User, db_token.user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
     # Rotate tokens — revoke old, issue new pair
-    services.revoke_refresh_token(db, payload.refresh_token)
+    if not services.revoke_refresh_token(db, payload.refresh_token):
+        raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
     new_access_token  = create_access_token(user.email)
     new_refresh_token = services.create_refresh_token(db, user.id)
 
@@ -335,30 +442,35 @@ def logout(
     return {"message": "Logged out successfully"}
 
 @app.post("/api/v1/users/change-password", tags=["Auth"])
-def change_password(
+async def change_password(
     payload: schemas.ChangePasswordRequest,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
 ):
-    if not verify_password(payload.current_password, current_user.password_hash):
+    if not await run_bcrypt(verify_password, payload.current_password, current_user.password_hash):
         raise HTTPException(status_code=400, detail="Current password is incorrect")
 
-    current_user.password_hash = hash_password(payload.new_password)
-    db.commit()
+    current_user.password_hash = await run_bcrypt(hash_password, payload.new_password)
+    await run_in_threadpool(db.commit)
+    forget_user_email(current_user.email)
     logger.info(f"Password changed for: {current_user.email}")
     return {"message": "Password updated successfully"}
 
 
 # ── Tasks ────────────────────────────────
 # Replace get_tasks route in main.py
-@app.get("/api/v1/tasks/", tags=["Tasks"])
+@app.get("/api/v1/tasks/", response_model=schemas.PaginatedResponse[schemas.TaskResponse], tags=["Tasks"])
 def get_tasks(
-    page:  int = 1,
-    limit: int = 20,
-    db:    Session = Depends(get_db),
+    page:   int = Query(1, ge=1),
+    limit:  int = Query(20, ge=1, le=100),   # bad input is a 422, not an empty slice
+    cursor: Optional[str] = None,
+    db:     Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    data = services.get_tasks(db, current_user.id, page, limit)
+    try:
+        data = services.get_tasks(db, current_user.id, page, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     logger.info(f"{current_user.email} — fetched tasks page {page}")
     return data
 
@@ -373,6 +485,7 @@ def create_task(
         db, task.title, task.priority,
         task.description, task.due_date, current_user.id
     )
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — created task: '{task.title}'")
     return new_task
 
@@ -386,6 +499,7 @@ def toggle_task(
     task = services.toggle_task(db, task_id, current_user.id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — toggled task {task_id} → {task.status}")
     return task
 
@@ -400,6 +514,7 @@ def edit_task(
     task = services.edit_task(db, task_id, current_user.id, payload.title)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — edited task {task_id}")
     return task
 
@@ -412,20 +527,25 @@ def delete_task(
 ):
     if not services.delete_task(db, task_id, current_user.id):
         raise HTTPException(status_code=404, detail="Task not found")
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — deleted task {task_id}")
     return {"message": "Task deleted"}
 
 
 # ── Habits ───────────────────────────────
 # Replace get_habits route in main.py
-@app.get("/api/v1/habits/", tags=["Habits"])
+@app.get("/api/v1/habits/", response_model=schemas.PaginatedResponse[schemas.HabitResponse], tags=["Habits"])
 def get_habits(
-    page:  int = 1,
-    limit: int = 20,
-    db:    Session = Depends(get_db),
+    page:   int = Query(1, ge=1),
+    limit:  int = Query(20, ge=1, le=100),   # bad input is a 422, not an empty slice
+    cursor: Optional[str] = None,
+    db:     Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    data = services.get_habits(db, current_user.id, page, limit)
+    try:
+        data = services.get_habits(db, current_user.id, page, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
     logger.info(f"{current_user.email} — fetched habits page {page}")
     return data
 
@@ -437,6 +557,7 @@ def create_habit(
     current_user: models.User = Depends(get_current_user)
 ):
     new_habit = services.create_habit(db, habit.name, habit.target_type, current_user.id)
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — created habit: '{habit.name}'")
     return new_habit
 
@@ -451,6 +572,7 @@ def edit_habit(
     habit = services.edit_habit(db, habit_id, current_user.id, payload.name)
     if not habit:
         raise HTTPException(status_code=404, detail="Habit not found")
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — edited habit {habit_id}")
     return habit
 
@@ -463,6 +585,7 @@ def delete_habit(
 ):
     if not services.delete_habit(db, habit_id, current_user.id):
         raise HTTPException(status_code=404, detail="Habit not found")
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — deleted habit {habit_id}")
     return {"message": "Habit deleted"}
 
@@ -477,16 +600,35 @@ def log_habit(
     result = services.log_habit(db, habit_id, log.date, log.completed, current_user.id)
     if not result:
         raise HTTPException(status_code=404, detail="Habit not found")
+    cache.invalidate_user(current_user.id)
     logger.info(f"{current_user.email} — logged habit {habit_id} on {log.date}")
     return result
 
 
+@app.post("/api/v1/habits/logs/bulk", response_model=schemas.HabitLogBulkResponse, tags=["Habits"])
+def log_habits_bulk(
+    payload: schemas.HabitLogBulkRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user)
+):
+    logged = services.log_habits_bulk(
+        db, current_user.id, [entry.model_dump() for entry in payload.logs]
+    )
+    cache.invalidate_user(current_user.id)
+    logger.info(f"{current_user.email} — bulk logged {logged} habit check-ins")
+    return {"logged": logged}
+
+
 # ── Dashboard ────────────────────────────
 @app.get("/api/v1/dashboard/", response_model=schemas.DashboardResponse, tags=["Dashboard"])
 def get_dashboard(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ):
-    data = services.get_dashboard(db, current_user.id)
+    key  = cache.dashboard_key(current_user.id)
+    data = cache.cache_get(key)
+    if data is None:
+        data = services.get_dashboard(db, current_user.id)
+        cache.cache_set(key, data)
     logger.info(f"{current_user.email} — fetched dashboard")
     return data
\ No newline at end of file
@@ -1,7 +1,7 @@
 # backend/models.py
 from sqlalchemy import (
-    Column, Integer, String, Boolean,
-    DateTime, Date, ForeignKey, Index
+    Column, Integer, BigInteger, String, Boolean,
+    DateTime, Date, ForeignKey, Index, LargeBinary, text
 )
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime, timezone
@@ -9,15 +9,21 @@ from datetime import datetime, timezone
 Base = declarative_base()
 
 
+def _utcnow() -> datetime:
+    # Naive UTC — exactly what a DateTime column reads back, so a freshly
+    # created object serializes the same as one loaded from the DB
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
 class User(Base):
     __tablename__ = "users"
 
     id            = Column(Integer, primary_key=True, index=True)
     name          = Column(String, nullable=False)
     email         = Column(String, unique=True, index=True, nullable=False)
-    password_hash = Column(String, nullable=False)
+    password_hash = Column(LargeBinary, nullable=False)   # raw bcrypt output
     role          = Column(String, default="user")
-    created_at    = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at    = Column(DateTime, default=_utcnow)
 
     tasks  = relationship("Task",  back_populates="owner", cascade="all, delete-orphan")
     habits = relationship("Habit", back_populates="owner", cascade="all, delete-orphan")
@@ -33,16 +39,18 @@ class Task(Base):
     due_date    = Column(DateTime, nullable=True)
     priority    = Column(String, default="medium")    # high | medium | low
     is_deleted  = Column(Boolean, default=False)      # soft delete
-    created_at  = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at  = Column(DateTime, default=_utcnow)
     user_id     = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     owner = relationship("User", back_populates="tasks")
 
     # Indexes for common queries
     __table_args__ = (
-        Index("ix_tasks_user_id",        "user_id"),
-        Index("ix_tasks_user_status",    "user_id", "status"),
-        Index("ix_tasks_user_deleted",   "user_id", "is_deleted"),
+        # user + live + status filter, newest-first sort — one index covers all of it
+        Index("ix_tasks_user_active_status", "user_id", "is_deleted", "status", "created_at"),
+        # keyset pagination — seek + ORDER BY created_at DESC, id DESC straight off the index;
+        # also covers the plain user_id lookups
+        Index("ix_tasks_user_active_created", "user_id", "is_deleted", "created_at", "id"),
     )
 
 
@@ -53,15 +61,19 @@ class Habit(Base):
     name        = Column(String, nullable=False)
     target_type = Column(String, default="daily")
     is_deleted  = Column(Boolean, default=False)      # soft delete
-    created_at  = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at  = Column(DateTime, default=_utcnow)
     user_id     = Column(Integer, ForeignKey("users.id"), nullable=False)
 
+    # Materialized streak — kept current by log_habit so reads never scan logs
+    current_streak   = Column(Integer, default=0, nullable=False)   # run of days ending at last_logged_date
+    last_logged_date = Column(Date, nullable=True)                  # newest completed check-in
+
     owner = relationship("User", back_populates="habits")
     logs  = relationship("HabitLog", back_populates="habit", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("ix_habits_user_id",      "user_id"),
-        Index("ix_habits_user_deleted", "user_id", "is_deleted"),
+        # keyset pagination — also covers the plain user and user + live filters
+        Index("ix_habits_user_active_created", "user_id", "is_deleted", "created_at", "id"),
     )
 
 
@@ -75,9 +87,12 @@ class HabitLog(Base):
 
     habit = relationship("Habit", back_populates="logs")
 
-    # Most queried combination — habit + date
+    # Most queried combination — habit + date (+ completed, so "logged today?" is index-only)
     __table_args__ = (
-        Index("ix_habit_logs_habit_date", "habit_id", "date"),
+        # equality columns first, then the date range/sort — streak and weekly queries read only the index
+        Index("ix_habit_logs_habit_completed_date", "habit_id", "completed", "date"),
+        # One log per habit per day — also the conflict target for upserts
+        Index("uq_habit_logs_habit_date", "habit_id", "date", unique=True),
     )
 
 # Add to models.py
@@ -85,15 +100,17 @@ class RefreshToken(Base):
     __tablename__ = "refresh_tokens"
 
     id         = Column(Integer, primary_key=True, index=True)
-    token      = Column(String, unique=True, index=True, nullable=False)  # unique already creates index
+    token_hash = Column(LargeBinary(32), unique=True, index=True, nullable=False)  # sha256 of the token — raw tokens are never stored
     user_id    = Column(Integer, ForeignKey("users.id"), nullable=False)
-    expires_at = Column(DateTime, nullable=False)
+    expires_at = Column(BigInteger, nullable=False)   # unix epoch seconds
     revoked    = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=_utcnow)
 
     __table_args__ = (
-        Index("ix_refresh_tokens_user_id", "user_id"),
         # ← removed ix_refresh_tokens_token from here, unique=True above handles it
+        # partial — revoke-all only ever looks at live tokens, revoked rows stay out of the index
+        Index("ix_refresh_tokens_user_active", "user_id",
+              postgresql_where=text("revoked = false"), sqlite_where=text("revoked = 0")),
     )
 
 # Add to models.py
@@ -106,8 +123,9 @@ class WeeklyReport(Base):
     week_end   = Column(Date, nullable=False)
     report     = Column(String, nullable=False)   # the generated text
     score      = Column(Integer, default=0)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, default=_utcnow)
 
     __table_args__ = (
-        Index("ix_weekly_reports_user_id", "user_id"),
+        # one report per user per week — also the conflict target for the weekly upsert
+        Index("uq_weekly_reports_user_week", "user_id", "week_start", unique=True),
     )
\ No newline at end of file
@@ -1,5 +1,5 @@
 # backend/schemas.py
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from datetime import datetime, date
 from typing import Optional
 
@@ -14,12 +14,13 @@ T = TypeVar('T')
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items:       list[T]
-    total:       int
+    total:       Optional[int]        # None on cursor pages — no COUNT is run
     page:        int
     limit:       int
-    total_pages: int
+    total_pages: Optional[int]
     has_next:    bool
     has_prev:    bool
+    next_cursor: Optional[str] = None # pass back as ?cursor= for the next page
 class UserCreate(BaseModel):
     name: str
     email: EmailStr
@@ -91,6 +92,18 @@ class HabitLogCreate(BaseModel):
     date: date
     completed: bool = True
 
+class HabitLogBulkEntry(BaseModel):
+    habit_id: int
+    date: date
+    completed: bool = True
+
+class HabitLogBulkRequest(BaseModel):
+    # Capped so one request stays one upsert batch — larger payloads get 422
+    logs: list[HabitLogBulkEntry] = Field(..., max_length=1000)
+
+class HabitLogBulkResponse(BaseModel):
+    logged: int
+
 class HabitLogResponse(BaseModel):
     id: int
     habit_id: int
@@ -136,4 +149,4 @@ class WeeklyReportResponse(BaseModel):
     created_at: datetime
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
@@ -1,42 +1,101 @@
 # backend/services.py
-from sqlalchemy.orm import Session
-from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import and_, case, func, literal, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Bundle, Session, raiseload
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 from models import Task, Habit, HabitLog, User, WeeklyReport
 
+def _upsert(db: Session, model, conflict_cols: list, update_cols: list):
+    """INSERT ... ON CONFLICT (conflict_cols) DO UPDATE SET update_cols — one atomic round trip."""
+    insert_ = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert_(model)
+    return stmt.on_conflict_do_update(
+        index_elements=conflict_cols,
+        set_={col: stmt.excluded[col] for col in update_cols},
+    )
+
+
 # ════════════════════════════════════════
 # TASK SERVICES
 # ════════════════════════════════════════
 
-# Replace get_tasks in services.py
-def get_tasks(db: Session, user_id: int, page: int = 1, limit: int = 20):
-    offset = (page - 1) * limit
+# ── Keyset pagination ──
+# Pages are sought by (created_at, id) instead of OFFSET, so page 50 costs the
+# same as page 1. The cursor is opaque to clients: base64("<created_at>|<id>").
 
-    base_query = db.query(Task).filter(
-        Task.user_id == user_id,
-        Task.is_deleted == False
-    )
+def _encode_cursor(created_at: datetime, row_id: int) -> str:
+    return urlsafe_b64encode(f"{created_at.isoformat()}|{row_id}".encode()).decode()
 
-    total = base_query.count()
 
-    tasks = (
-        base_query
-        .order_by(Task.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+def _decode_cursor(cursor: str) -> tuple:
+    """Raises ValueError on a malformed cursor."""
+    try:
+        created_at, row_id = urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
 
-    return {
-        "items":       tasks,
+
+def _paginate(base_query, model, page: int, limit: int, cursor: Optional[str]):
+    """
+    Returns (rows, meta). With a cursor, seeks past it and skips the COUNT —
+    total/total_pages come back as None. Without one, the classic page/offset
+    path is kept so existing ?page= clients keep working; its total rides
+    along on every row as COUNT(*) OVER () instead of a second query.
+    """
+    ordered = base_query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor:
+        ordered = ordered.filter(tuple_(model.created_at, model.id) < _decode_cursor(cursor))
+        rows    = ordered.limit(limit + 1).all()   # one extra row answers has_next
+        total   = None
+    else:
+        counted = (
+            ordered.add_columns(func.count().over().label("total"))
+            .offset((page - 1) * limit)
+            .limit(limit + 1)
+            .all()
+        )
+        rows  = [row[0] for row in counted]
+        # a page past the end has no rows to carry the total — ask directly
+        total = counted[0].total if counted else (base_query.count() if page > 1 else 0)
+
+    has_next = len(rows) > limit
+    rows     = rows[:limit]
+
+    return rows, {
         "total":       total,
         "page":        page,
         "limit":       limit,
-        "total_pages": max(1, -(-total // limit)),  # ceiling division
-        "has_next":    page * limit < total,
+        "total_pages": max(1, -(-total // limit)) if total is not None else None,  # ceiling division
+        "has_next":    has_next,
         "has_prev":    page > 1,
+        "next_cursor": _encode_cursor(rows[-1].created_at, rows[-1].id) if has_next else None,
     }
 
 
+# Plain column rows for list pages — no ORM instances or identity-map bookkeeping
+TASK_ROW = Bundle(
+    "task",
+    Task.id, Task.title, Task.description, Task.status,
+    Task.due_date, Task.priority, Task.created_at, Task.user_id,
+    single_entity=True,
+)
+
+
+def get_tasks(db: Session, user_id: int, page: int = 1, limit: int = 20,
+              cursor: Optional[str] = None):
+    base_query = db.query(TASK_ROW).filter(
+        Task.user_id == user_id,
+        Task.is_deleted == False
+    )
+
+    tasks, meta = _paginate(base_query, Task, page, limit, cursor)
+    return {"items": tasks, **meta}
 
 
 def create_task(db: Session, title: str, priority: str,
@@ -50,137 +109,150 @@ def create_task(db: Session, title: str, priority: str,
     )
     db.add(task)
     db.commit()
-    db.refresh(task)
     return task
 
 
-def toggle_task(db: Session, task_id: int, user_id: int):
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == user_id,
-        Task.is_deleted == False
-    ).first()
-
-    if not task:
-        return None
-
-    task.status = "completed" if task.status != "completed" else "pending"
+def _update_live_task(db: Session, task_id: int, user_id: int, **values):
+    """UPDATE ... RETURNING on one of the user's live tasks — no SELECT first. None if there's no such task."""
+    stmt = (
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id, Task.is_deleted == False)
+        .values(**values)
+        .returning(Task)
+    )
+    task = db.scalars(stmt, execution_options={"populate_existing": True}).one_or_none()
     db.commit()
-    db.refresh(task)
     return task
 
 
-def edit_task(db: Session, task_id: int, user_id: int, new_title: str):
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == user_id,
-        Task.is_deleted == False
-    ).first()
+def toggle_task(db: Session, task_id: int, user_id: int):
+    # Flipped in SQL, so two quick toggles can't both read the same old status
+    return _update_live_task(
+        db, task_id, user_id,
+        status=case((Task.status == "completed", "pending"), else_="completed"),
+    )
 
-    if not task:
-        return None
 
-    task.title = new_title
-    db.commit()
-    db.refresh(task)
-    return task
+def edit_task(db: Session, task_id: int, user_id: int, new_title: str):
+    return _update_live_task(db, task_id, user_id, title=new_title)
 
 
 def delete_task(db: Session, task_id: int, user_id: int):
-    task = db.query(Task).filter(
-        Task.id == task_id,
-        Task.user_id == user_id,
-        Task.is_deleted == False
-    ).first()
-
-    if not task:
-        return False
-
-    task.is_deleted = True   # soft delete — data is never truly lost
+    # soft delete — data is never truly lost
+    deleted = db.execute(
+        update(Task)
+        .where(Task.id == task_id, Task.user_id == user_id, Task.is_deleted == False)
+        .values(is_deleted=True)
+        .returning(Task.id)
+    ).scalar()
     db.commit()
-    return True
+    return deleted is not None
 
 
 # ════════════════════════════════════════
 # HABIT SERVICES
 # ════════════════════════════════════════
 
-def _calculate_streak(logs: list, today: date) -> tuple[int, bool]:
+def _day_number(db: Session, value):
+    """SQL expression numbering calendar days consecutively, so "the next day" is "+ 1"."""
+    if db.get_bind().dialect.name == "sqlite":
+        return func.julianday(value)
+    return value - literal(date(1970, 1, 1))
+
+
+def _latest_runs(db: Session, *criteria):
     """
-    Given a list of completed HabitLog objects (sorted newest first),
-    returns (streak_count, is_logged_today).
+    Query of (habit_id, last_date, run) for habits with completed logs
+    matching criteria: each habit's newest check-in and the run of
+    consecutive days ending there.
+
+    Completed logs are numbered newest-first per habit. Along a run of
+    consecutive days day_number(date) + row_number stays constant, so the
+    rows sharing the newest log's value are exactly its run.
     """
-    streak = 0
-    is_logged_today = False
-    check_date = today
+    row_number = func.row_number().over(
+        partition_by=HabitLog.habit_id,
+        order_by=HabitLog.date.desc(),
+    )
+    ranked = (
+        db.query(
+            HabitLog.habit_id,
+            HabitLog.date,
+            (_day_number(db, HabitLog.date) + row_number).label("grp"),
+            row_number.label("rn"),
+        )
+        .filter(*criteria, HabitLog.completed == True)
+        .cte("ranked")   # read twice below — a CTE numbers the logs once
+    )
+    latest = (
+        db.query(ranked.c.habit_id, ranked.c.date, ranked.c.grp)
+        .filter(ranked.c.rn == 1)
+        .subquery()
+    )
 
-    for log in logs:
-        if log.date == today:
-            is_logged_today = True
-            streak += 1
-            check_date = today - timedelta(days=1)
-        elif log.date == check_date:
-            streak += 1
-            check_date -= timedelta(days=1)
-        elif log.date < check_date:
-            break  # gap found — streak is broken
+    return (
+        db.query(latest.c.habit_id, latest.c.date, func.count())
+        .join(ranked, and_(ranked.c.habit_id == latest.c.habit_id,
+                           ranked.c.grp == latest.c.grp))
+        .group_by(latest.c.habit_id, latest.c.date)
+    )
 
-    return streak, is_logged_today
+
+def _refresh_streaks(db: Session, habit_ids):
+    """Recomputes the materialized streak columns of these habits from their logs (no commit)."""
+    if not habit_ids:
+        return
+    runs = {
+        habit_id: (last_date, run) for habit_id, last_date, run in
+        _latest_runs(db, HabitLog.habit_id.in_(habit_ids))
+    }
+    db.execute(update(Habit), [
+        {"id": habit_id, "last_logged_date": runs.get(habit_id, (None, 0))[0],
+         "current_streak": runs.get(habit_id, (None, 0))[1]}
+        for habit_id in habit_ids
+    ])
+
+
+def _live_streak(current_streak: int, last_logged_date, today: date) -> int:
+    # A run only counts while it reaches today — yesterday's run reads 0 until today's check-in.
+    # A check-in dated past the server's today (client in a later timezone) still counts.
+    if last_logged_date is None or last_logged_date < today:
+        return 0
+    return current_streak
 
 
 # Replace get_habits in services.py
-def get_habits(db: Session, user_id: int, page: int = 1, limit: int = 20):
-    offset = (page - 1) * limit
-    today  = date.today()
+def get_habits(db: Session, user_id: int, page: int = 1, limit: int = 20,
+               cursor: Optional[str] = None):
+    today = date.today()
 
     base_query = db.query(Habit).filter(
         Habit.user_id == user_id,
         Habit.is_deleted == False
     )
 
-    total  = base_query.count()
-    habits = (
-        base_query
-        .order_by(Habit.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+    # raiseload flags any lazy load that would sneak an N+1 back in
+    habits, meta = _paginate(base_query.options(raiseload("*")), Habit, page, limit, cursor)
 
     result = []
     for habit in habits:
-        logs = (
-            db.query(HabitLog)
-            .filter(HabitLog.habit_id == habit.id, HabitLog.completed == True)
-            .order_by(HabitLog.date.desc())
-            .all()
-        )
-        streak, is_logged_today = _calculate_streak(logs, today)
+        streak = _live_streak(habit.current_streak, habit.last_logged_date, today)
         result.append({
             "id":              habit.id,
             "name":            habit.name,
             "target_type":     habit.target_type,
             "user_id":         habit.user_id,
             "current_streak":  streak,
-            "is_logged_today": is_logged_today,
+            "is_logged_today": streak > 0,
         })
 
-    return {
-        "items":       result,
-        "total":       total,
-        "page":        page,
-        "limit":       limit,
-        "total_pages": max(1, -(-total // limit)),
-        "has_next":    page * limit < total,
-        "has_prev":    page > 1,
-    }
+    return {"items": result, **meta}
 
 
 def create_habit(db: Session, name: str, target_type: str, user_id: int):
     habit = Habit(name=name, target_type=target_type, user_id=user_id)
     db.add(habit)
     db.commit()
-    db.refresh(habit)
     return {
         "id": habit.id, "name": habit.name,
         "target_type": habit.target_type, "user_id": habit.user_id,
@@ -189,18 +261,17 @@ def create_habit(db: Session, name: str, target_type: str, user_id: int):
 
 
 def edit_habit(db: Session, habit_id: int, user_id: int, new_name: str):
-    habit = db.query(Habit).filter(
-        Habit.id == habit_id,
-        Habit.user_id == user_id,
-        Habit.is_deleted == False
+    habit = db.execute(
+        update(Habit)
+        .where(Habit.id == habit_id, Habit.user_id == user_id, Habit.is_deleted == False)
+        .values(name=new_name)
+        .returning(Habit.id, Habit.name, Habit.target_type, Habit.user_id)
     ).first()
+    db.commit()
 
     if not habit:
         return None
 
-    habit.name = new_name
-    db.commit()
-    db.refresh(habit)
     return {
         "id": habit.id, "name": habit.name,
         "target_type": habit.target_type, "user_id": habit.user_id,
@@ -209,24 +280,24 @@ def edit_habit(db: Session, habit_id: int, user_id: int, new_name: str):
 
 
 def delete_habit(db: Session, habit_id: int, user_id: int):
-    habit = db.query(Habit).filter(
-        Habit.id == habit_id,
-        Habit.user_id == user_id,
-        Habit.is_deleted == False
-    ).first()
+    # soft delete
+    deleted = db.execute(
+        update(Habit)
+        .where(Habit.id == habit_id, Habit.user_id == user_id, Habit.is_deleted == False)
+        .values(is_deleted=True)
+        .returning(Habit.id)
+    ).scalar()
+    db.commit()
+    return deleted is not None
 
-    if not habit:
-        return False
 
-    habit.is_deleted = True   # soft delete
-    db.commit()
-    return True
+HABIT_LOG_BATCH_SIZE = 1000
 
 
 def log_habit(db: Session, habit_id: int, log_date: date,
               completed: bool, user_id: int):
-    # Verify habit belongs to this user
-    habit = db.query(Habit).filter(
+    # Verify habit belongs to this user — and read its streak state
+    habit = db.query(Habit.current_streak, Habit.last_logged_date).filter(
         Habit.id == habit_id,
         Habit.user_id == user_id,
         Habit.is_deleted == False
@@ -236,53 +307,117 @@ def log_habit(db: Session, habit_id: int, log_date: date,
         return None
 
     # Upsert — update if exists, create if not
-    existing = db.query(HabitLog).filter(
-        HabitLog.habit_id == habit_id,
-        HabitLog.date == log_date
-    ).first()
+    stmt = (
+        _upsert(db, HabitLog, ["habit_id", "date"], ["completed"])
+        .values(habit_id=habit_id, date=log_date, completed=completed)
+        .returning(HabitLog)
+    )
+    log = db.scalars(stmt, execution_options={"populate_existing": True}).one()
+
+    # ── Keep the materialized streak current ──
+    last = habit.last_logged_date
+    if last is None or log_date > last:
+        if completed:
+            extends = last is not None and log_date == last + timedelta(days=1)
+            streak  = habit.current_streak + 1 if extends else 1
+            # Guarded on the state we read — if another request moved it, recompute instead
+            moved = db.query(Habit).filter(
+                Habit.id == habit_id,
+                Habit.last_logged_date == last
+            ).update({"current_streak": streak, "last_logged_date": log_date})
+            if not moved:
+                _refresh_streaks(db, [habit_id])
+    elif not (completed and log_date == last):
+        # Backfills and undos at or behind the newest check-in can split or join runs
+        _refresh_streaks(db, [habit_id])
+
+    db.commit()
+    return log
+
 
-    if existing:
-        existing.completed = completed
-        db.commit()
-        db.refresh(existing)
-        return existing
+def log_habits_bulk(db: Session, user_id: int, entries: list) -> int:
+    """
+    Upserts many habit logs at once.
+    entries: [{"habit_id": ..., "date": ..., "completed": ...}, ...]
+    Entries for habits the user doesn't own (or deleted ones) are skipped.
+    Returns the number of logs written.
+    """
+    habit_ids = {e["habit_id"] for e in entries}
+    if not habit_ids:
+        return 0
+    owned = {
+        habit_id for (habit_id,) in
+        db.query(Habit.id).filter(
+            Habit.id.in_(habit_ids),
+            Habit.user_id == user_id,
+            Habit.is_deleted == False
+        )
+    }
+
+    # Last entry wins for a repeated (habit, date) — one statement can't upsert a row twice
+    rows = {
+        (e["habit_id"], e["date"]): {"habit_id": e["habit_id"], "date": e["date"], "completed": e.get("completed", True)}
+        for e in entries if e["habit_id"] in owned
+    }
+    rows = list(rows.values())
 
-    new_log = HabitLog(habit_id=habit_id, date=log_date, completed=completed)
-    db.add(new_log)
+    stmt = _upsert(db, HabitLog, ["habit_id", "date"], ["completed"])
+    for i in range(0, len(rows), HABIT_LOG_BATCH_SIZE):
+        db.execute(stmt, rows[i:i + HABIT_LOG_BATCH_SIZE])
+    _refresh_streaks(db, list({row["habit_id"] for row in rows}))
     db.commit()
-    db.refresh(new_log)
-    return new_log
+    return len(rows)
 
 
 # ════════════════════════════════════════
 # DASHBOARD SERVICE
 # ════════════════════════════════════════
 
+def _task_status_counts(db: Session, user_id: int) -> dict:
+    """{status: count} for a user's live tasks — aggregated in SQL, no task rows loaded."""
+    return dict(
+        db.query(Task.status, func.count(Task.id))
+        .filter(Task.user_id == user_id, Task.is_deleted == False)
+        .group_by(Task.status)
+        .all()
+    )
+
+
 def get_dashboard(db: Session, user_id: int):
     today      = date.today()
     week_start = today - timedelta(days=today.weekday())
 
     # ── Tasks ──
-    all_tasks       = db.query(Task).filter(Task.user_id == user_id, Task.is_deleted == False).all()
-    total_tasks     = len(all_tasks)
-    completed_tasks = sum(1 for t in all_tasks if t.status == "completed")
+    by_status       = _task_status_counts(db, user_id)
+    total_tasks     = sum(by_status.values())
+    completed_tasks = by_status.get("completed", 0)
     pending_tasks   = total_tasks - completed_tasks
     task_rate       = round((completed_tasks / total_tasks * 100) if total_tasks else 0, 1)
 
-    # ── Habits ──
-    all_habits         = db.query(Habit).filter(Habit.user_id == user_id, Habit.is_deleted == False).all()
+    # ── Habits (only the columns the dashboard shows) + each one's check-ins this week ──
+    # Correlated count rides along on the habit rows — one round trip instead of two
+    week_logs          = (
+        select(func.count(HabitLog.id))
+        .where(
+            HabitLog.habit_id == Habit.id,
+            HabitLog.completed == True,
+            HabitLog.date >= week_start
+        )
+        .correlate(Habit)
+        .scalar_subquery()
+    )
+    all_habits         = (
+        db.query(Habit.name, Habit.current_streak, Habit.last_logged_date, week_logs.label("week_logs"))
+        .filter(Habit.user_id == user_id, Habit.is_deleted == False)
+        .all()
+    )
     total_habits       = len(all_habits)
     habits_logged_today = 0
     current_streaks    = []
 
     for habit in all_habits:
-        logs = (
-            db.query(HabitLog)
-            .filter(HabitLog.habit_id == habit.id, HabitLog.completed == True)
-            .order_by(HabitLog.date.desc())
-            .all()
-        )
-        streak, is_logged_today = _calculate_streak(logs, today)
+        streak          = _live_streak(habit.current_streak, habit.last_logged_date, today)
+        is_logged_today = streak > 0
         if is_logged_today:
             habits_logged_today += 1
 
@@ -294,17 +429,7 @@ def get_dashboard(db: Session, user_id: int):
 
     # ── Habit consistency this week ──
     total_possible = total_habits * 7 if total_habits else 0
-    logs_this_week = (
-        db.query(HabitLog)
-        .join(Habit)
-        .filter(
-            Habit.user_id == user_id,
-            Habit.is_deleted == False,
-            HabitLog.completed == True,
-            HabitLog.date >= week_start
-        )
-        .count()
-    )
+    logs_this_week = sum(habit.week_logs for habit in all_habits)
     habit_rate = round((logs_this_week / total_possible * 100) if total_possible else 0, 1)
 
     # ── Productivity score — 60% tasks, 40% habits ──
@@ -328,29 +453,36 @@ def get_dashboard(db: Session, user_id: int):
 # ════════════════════════════════════════
 
 def get_user_by_email(db: Session, email: str):
-    return db.query(User).filter(User.email == email).first()
+    return db.scalars(select(User).where(User.email == email).limit(1)).first()
 
 
-def create_user(db: Session, name: str, email: str, password_hash: str):
+def create_user(db: Session, name: str, email: str, password_hash: bytes):
     user = User(name=name, email=email, password_hash=password_hash)
     db.add(user)
     db.commit()
-    db.refresh(user)
     return user
 
 # Add to services.py
+import hashlib
 import secrets
+import time
 from models import RefreshToken
 
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+
+def _hash_refresh_token(token: str) -> bytes:
+    # Fixed 32-byte key — smaller index than the 86-char token, and a DB dump leaks nothing usable
+    return hashlib.sha256(token.encode()).digest()
+
+
 def create_refresh_token(db: Session, user_id: int) -> str:
     # Generate a secure random token
     token = secrets.token_urlsafe(64)
-    expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_at = int(time.time()) + REFRESH_TOKEN_EXPIRE_DAYS * 86400
 
     db_token = RefreshToken(
-        token=token,
+        token_hash=_hash_refresh_token(token),
         user_id=user_id,
         expires_at=expires_at
     )
@@ -360,19 +492,22 @@ def create_refresh_token(db: Session, user_id: int) -> str:
 
 
 def get_refresh_token(db: Session, token: str):
-    return db.query(RefreshToken).filter(
-        RefreshToken.token == token,
+    stmt = select(RefreshToken).where(
+        RefreshToken.token_hash == _hash_refresh_token(token),
         RefreshToken.revoked == False
-    ).first()
+    ).limit(1)
+    return db.scalars(stmt).first()
 
 
-def revoke_refresh_token(db: Session, token: str):
-    db_token = db.query(RefreshToken).filter(
-        RefreshToken.token == token
-    ).first()
-    if db_token:
-        db_token.revoked = True
-        db.commit()
+def revoke_refresh_token(db: Session, token: str) -> bool:
+    # One UPDATE on the hash index, no SELECT first. False when the token was
+    # unknown or already revoked — so of two racing rotations only one wins.
+    revoked = db.query(RefreshToken).filter(
+        RefreshToken.token_hash == _hash_refresh_token(token),
+        RefreshToken.revoked == False
+    ).update({"revoked": True})
+    db.commit()
+    return revoked > 0
 
 
 def revoke_all_user_tokens(db: Session, user_id: int):
@@ -383,35 +518,87 @@ def revoke_all_user_tokens(db: Session, user_id: int):
     ).update({"revoked": True})
     db.commit()
 
+def _report_week(today: date) -> tuple[date, date]:
+    week_end   = today - timedelta(days=1)           # yesterday (Sunday)
+    week_start = week_end - timedelta(days=6)         # last Monday
+    return week_start, week_end
+
+
+# Report opener by score — first threshold the score reaches wins
+_OPENINGS = (
+    (80, "Outstanding week, {name}! You were firing on all cylinders."),
+    (60, "Solid week, {name}! You made real progress."),
+    (40, "Decent effort this week, {name}. There's room to push harder."),
+    (0,  "Tough week, {name}. Every week is a fresh start — let's go."),
+)
+
+
+@lru_cache(maxsize=8)
+def _week_label(week_start: date, week_end: date) -> str:
+    # Same for every user in a run — format the dates once, not once per report
+    return f"Week: {week_start.strftime('%b %d')} — {week_end.strftime('%b %d, %Y')}"
+
+
+def _compose_weekly_report(name: str, completed_tasks: int, total_tasks: int,
+                           total_habits: int, logs_this_week: int,
+                           best_habit, best_streak: int,
+                           week_start: date, week_end: date) -> tuple[str, int]:
+    """
+    Turns one user's weekly numbers into (report_text, weekly_score).
+    Shared by the single-user and the all-users report paths.
+    """
+    possible_logs  = total_habits * 7
+    habit_rate     = round((logs_this_week / possible_logs * 100) if possible_logs else 0)
+    task_rate      = round((completed_tasks / total_tasks * 100) if total_tasks else 0)
+    weekly_score   = round((task_rate * 0.6) + (habit_rate * 0.4))
+
+    opening = next(text for threshold, text in _OPENINGS if weekly_score >= threshold)
+
+    streak_line = (
+        f"Your best streak is '{best_habit}' at {best_streak} days — keep it going!"
+        if best_habit else "Start a habit this week to build your first streak."
+    )
+
+    report_text = "\n".join((
+        opening.format(name=name),
+        "",
+        f"Tasks: You completed {completed_tasks} out of {total_tasks} tasks ({task_rate}%).",
+        f"Habits: You logged {logs_this_week} out of {possible_logs} possible check-ins ({habit_rate}%).",
+        f"Weekly Score: {weekly_score}/100",
+        "",
+        streak_line,
+        "",
+        _week_label(week_start, week_end),
+    ))
+    return report_text, weekly_score
+
+
 def generate_weekly_report(db: Session, user: User) -> dict:
     """
     Calculates a full week summary for one user and saves it to DB.
-    Called automatically by the background job every Monday.
+    Used by the manual "generate now" endpoint.
     """
-    today      = date.today()
-    week_end   = today - timedelta(days=1)           # yesterday (Sunday)
-    week_start = week_end - timedelta(days=6)         # last Monday
+    today                = date.today()
+    week_start, week_end = _report_week(today)
 
     # ── Tasks this week ──
-    all_tasks = db.query(Task).filter(
-        Task.user_id   == user.id,
-        Task.is_deleted == False
-    ).all()
-
-    completed_this_week = sum(
-        1 for t in all_tasks
-        if t.status == 'completed'
-    )
-    total_tasks = len(all_tasks)
+    by_status           = _task_status_counts(db, user.id)
+    completed_this_week = by_status.get('completed', 0)
+    total_tasks         = sum(by_status.values())
 
     # ── Habits this week ──
-    all_habits = db.query(Habit).filter(
-        Habit.user_id   == user.id,
-        Habit.is_deleted == False
-    ).all()
+    all_habits = (
+        db.query(Habit.name, Habit.current_streak, Habit.last_logged_date)
+        .filter(
+            Habit.user_id   == user.id,
+            Habit.is_deleted == False
+        )
+        .order_by(Habit.id)
+        .all()
+    )
 
     logs_this_week = (
-        db.query(HabitLog)
+        db.query(func.count(HabitLog.id))
         .join(Habit)
         .filter(
             Habit.user_id    == user.id,
@@ -420,88 +607,145 @@ def generate_weekly_report(db: Session, user: User) -> dict:
             HabitLog.date     >= week_start,
             HabitLog.date     <= week_end,
         )
-        .count()
+        .scalar()
     )
 
-    total_habits   = len(all_habits)
-    possible_logs  = total_habits * 7
-    habit_rate     = round((logs_this_week / possible_logs * 100) if possible_logs else 0)
-    task_rate      = round((completed_this_week / total_tasks * 100) if total_tasks else 0)
-    weekly_score   = round((task_rate * 0.6) + (habit_rate * 0.4))
-
-    # ── Best streak this week ──
+    # ── Best streak this week — straight off the materialized columns, no log reads ──
     best_habit     = None
     best_streak    = 0
     for habit in all_habits:
-        logs = (
-            db.query(HabitLog)
-            .filter(HabitLog.habit_id == habit.id, HabitLog.completed == True)
-            .order_by(HabitLog.date.desc())
-            .all()
-        )
-        streak, _ = _calculate_streak(logs, today)
+        streak = _live_streak(habit.current_streak, habit.last_logged_date, today)
         if streak > best_streak:
             best_streak = streak
             best_habit  = habit.name
 
     # ── Build report text ──
     name = user.name or user.email.split('@')[0]
+    report_text, weekly_score = _compose_weekly_report(
+        name, completed_this_week, total_tasks,
+        len(all_habits), logs_this_week,
+        best_habit, best_streak, week_start, week_end,
+    )
 
-    if weekly_score >= 80:
-        opening = f"Outstanding week, {name}! You were firing on all cylinders."
-    elif weekly_score >= 60:
-        opening = f"Solid week, {name}! You made real progress."
-    elif weekly_score >= 40:
-        opening = f"Decent effort this week, {name}. There's room to push harder."
-    else:
-        opening = f"Tough week, {name}. Every week is a fresh start — let's go."
-
-    streak_line = (
-        f"Your best streak is '{best_habit}' at {best_streak} days — keep it going!"
-        if best_habit else "Start a habit this week to build your first streak."
+    # ── Save to DB — upsert on (user, week), no lookup first ──
+    db.execute(
+        _upsert(db, WeeklyReport, ["user_id", "week_start"], ["week_end", "report", "score"])
+        .values(
+            user_id    = user.id,
+            week_start = week_start,
+            week_end   = week_end,
+            report     = report_text,
+            score      = weekly_score,
+        )
     )
+    db.commit()
+    return {"report": report_text, "score": weekly_score}
+
+
+WEEKLY_BATCH_SIZE = 1000
 
-    report_text = (
-        f"{opening}\n\n"
-        f"Tasks: You completed {completed_this_week} out of {total_tasks} tasks ({task_rate}%).\n"
-        f"Habits: You logged {logs_this_week} out of {possible_logs} possible check-ins ({habit_rate}%).\n"
-        f"Weekly Score: {weekly_score}/100\n\n"
-        f"{streak_line}\n\n"
-        f"Week: {week_start.strftime('%b %d')} — {week_end.strftime('%b %d, %Y')}"
+
+def generate_weekly_reports(db: Session) -> dict:
+    """
+    Generates this week's report for every user in one pass.
+    Called automatically by the background job every Monday.
+
+    Each statistic is one set-based query across all users instead of a
+    handful of queries per user. Rows are streamed WEEKLY_BATCH_SIZE at a
+    time and reports upserted in batches of the same size, so memory holds
+    the per-user numbers but never a whole result set or all report texts.
+    Returns {user_id: score}.
+    """
+    today                = date.today()
+    week_start, week_end = _report_week(today)
+
+    # ── Tasks per user: (total, completed) ──
+    task_counts = {
+        user_id: (total, completed or 0)
+        for user_id, total, completed in (
+            db.query(
+                Task.user_id,
+                func.count(Task.id),
+                func.sum(case((Task.status == "completed", 1), else_=0)),
+            )
+            .filter(Task.is_deleted == False)
+            .group_by(Task.user_id)
+            .yield_per(WEEKLY_BATCH_SIZE)
+        )
+    }
+
+    # ── Active habits per user ──
+    habit_counts = dict(
+        db.query(Habit.user_id, func.count(Habit.id))
+        .filter(Habit.is_deleted == False)
+        .group_by(Habit.user_id)
+        .yield_per(WEEKLY_BATCH_SIZE)
     )
 
-    # ── Save to DB (avoid duplicates for same week) ──
-    existing = db.query(WeeklyReport).filter(
-        WeeklyReport.user_id    == user.id,
-        WeeklyReport.week_start == week_start,
-    ).first()
+    # ── Completed check-ins this week per user ──
+    week_log_counts = dict(
+        db.query(Habit.user_id, func.count(HabitLog.id))
+        .join(Habit)
+        .filter(
+            Habit.is_deleted  == False,
+            HabitLog.completed == True,
+            HabitLog.date     >= week_start,
+            HabitLog.date     <= week_end,
+        )
+        .group_by(Habit.user_id)
+        .yield_per(WEEKLY_BATCH_SIZE)
+    )
 
-    if existing:
-        existing.report = report_text
-        existing.score  = weekly_score
-        db.commit()
-        return {"report": report_text, "score": weekly_score}
-
-    new_report = WeeklyReport(
-        user_id    = user.id,
-        week_start = week_start,
-        week_end   = week_end,
-        report     = report_text,
-        score      = weekly_score,
+    # ── Best streak per user — materialized streaks, first habit wins a tie ──
+    best_streaks = {}
+    rows = (
+        db.query(Habit.user_id, Habit.name, Habit.current_streak, Habit.last_logged_date)
+        .filter(Habit.is_deleted == False, Habit.last_logged_date >= today)
+        .order_by(Habit.id)
+        .yield_per(WEEKLY_BATCH_SIZE)
     )
-    db.add(new_report)
+    for user_id, habit_name, current_streak, last_logged_date in rows:
+        streak = _live_streak(current_streak, last_logged_date, today)
+        if streak > best_streaks.get(user_id, (None, 0))[1]:
+            best_streaks[user_id] = (habit_name, streak)
+
+    # ── Compose + upsert reports — one INSERT ... ON CONFLICT per batch of users ──
+    upsert = _upsert(db, WeeklyReport, ["user_id", "week_start"], ["week_end", "report", "score"])
+    users  = db.query(User.id, User.name, User.email).yield_per(WEEKLY_BATCH_SIZE)
+    rows   = []
+    scores = {}
+
+    for user_id, name, email in users:
+        total_tasks, completed_tasks = task_counts.get(user_id, (0, 0))
+        best_habit, best_streak      = best_streaks.get(user_id, (None, 0))
+        report_text, weekly_score = _compose_weekly_report(
+            name or email.split('@')[0], completed_tasks, total_tasks,
+            habit_counts.get(user_id, 0), week_log_counts.get(user_id, 0),
+            best_habit, best_streak, week_start, week_end,
+        )
+        scores[user_id] = weekly_score
+        rows.append({
+            "user_id":    user_id,
+            "week_start": week_start,
+            "week_end":   week_end,
+            "report":     report_text,
+            "score":      weekly_score,
+        })
+        if len(rows) >= WEEKLY_BATCH_SIZE:
+            db.execute(upsert, rows)
+            rows = []
+
+    if rows:
+        db.execute(upsert, rows)
     db.commit()
-    return {"report": report_text, "score": weekly_score}
+    return scores
 
 
 def get_latest_report(db: Session, user_id: int):
-    return (
-        db.query(WeeklyReport)
-        .filter(WeeklyReport.user_id == user_id)
-        .order_by(WeeklyReport.created_at.desc())
-        .first()
+    stmt = (
+        select(WeeklyReport)
+        .where(WeeklyReport.user_id == user_id)
+        .order_by(WeeklyReport.week_start.desc())   # LIMIT 1 straight off (user_id, week_start)
+        .limit(1)
     )
-
-
-def get_all_users(db: Session):
-    return db.query(User).all()
\ No newline at end of file
+    return db.scalars(stmt).first()
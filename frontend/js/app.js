@@ -229,12 +229,15 @@ function toggleMobileSidebar() {
 // ── Task pagination state ──
 let taskPage = 1;
 let taskHasNext = false;
+let taskCursor  = null;
 
 async function loadTasks(page = 1) {
     try {
-        const data = await apiFetch(`/tasks/?page=${page}&limit=20`);
+        const cursor = page > 1 && taskCursor ? `&cursor=${encodeURIComponent(taskCursor)}` : '';
+        const data = await apiFetch(`/tasks/?page=${page}&limit=20${cursor}`);
         taskPage    = data.page;
         taskHasNext = data.has_next;
+        taskCursor  = data.next_cursor;
 
         if (page === 1) {
             renderTasks(data.items, data);
@@ -356,12 +359,15 @@ function taskHTML(task) {
 // ── Habit pagination state ──
 let habitPage    = 1;
 let habitHasNext = false;
+let habitCursor  = null;
 
 async function loadHabits(page = 1) {
     try {
-        const data   = await apiFetch(`/habits/?page=${page}&limit=20`);
+        const cursor = page > 1 && habitCursor ? `&cursor=${encodeURIComponent(habitCursor)}` : '';
+        const data   = await apiFetch(`/habits/?page=${page}&limit=20${cursor}`);
         habitPage    = data.page;
         habitHasNext = data.has_next;
+        habitCursor  = data.next_cursor;
 
         if (page === 1) {
             renderHabits(data.items, data);